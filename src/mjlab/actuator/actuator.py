@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
@@ -26,6 +28,11 @@ class TransmissionType(str, Enum):
   SITE = "site"
 
 
+@functools.cache
+def _compile_exprs(exprs: tuple[str, ...]) -> tuple[re.Pattern[str], ...]:
+  return tuple(re.compile(expr) for expr in exprs)
+
+
 @dataclass(kw_only=True)
 class ActuatorCfg(ABC):
   target_names_expr: tuple[str, ...]
@@ -58,6 +65,16 @@ class ActuatorCfg(ABC):
           "SITE transmission type."
         )
 
+  @property
+  def target_names_patterns(self) -> tuple[re.Pattern[str], ...]:
+    """Compiled regexes for :attr:`target_names_expr`.
+
+    Compiled once per distinct expression tuple and shared between configs, so
+    matching target names never recompiles them. Reassigning
+    ``target_names_expr`` is picked up on the next access.
+    """
+    return _compile_exprs(tuple(self.target_names_expr))
+
   @abstractmethod
   def build(
     self, entity: Entity, target_ids: list[int], target_names: list[str]
@@ -19,6 +19,9 @@ from mjlab.asset_zoo.robots.unitree_go1.go1_constants import (
 from mjlab.asset_zoo.robots.x02.x02_constants import (
   X02_ACTION_SCALE as X02_ACTION_SCALE,
 )
+from mjlab.asset_zoo.robots.x02.x02_constants import (
+  X02_ACTION_SCALE_ITEMS as X02_ACTION_SCALE_ITEMS,
+)
 from mjlab.asset_zoo.robots.x02.x02_constants import (
   get_x02_robot_cfg as get_x02_robot_cfg,
 )
@@ -1,5 +1,7 @@
 """BitBots x02 constants."""
 
+import functools
+import re
 from pathlib import Path
 
 import mujoco
@@ -15,17 +17,41 @@ from mjlab.utils.spec_config import CollisionCfg
 ##
 
 X02_URDF: Path = MJLAB_SRC_PATH / "asset_zoo" / "robots" / "x02" / "xmls" / "x02.urdf"
-assert X02_URDF.exists()
 
 
-def get_assets(meshdir: str) -> dict[str, bytes]:
+# Parsed URDF specs keyed by (path, mtime), so repeated get_spec() calls only pay
+# for a copy instead of re-parsing the file.
+_SPEC_CACHE: dict[tuple[str, int], mujoco.MjSpec] = {}
+
+
+def _require_urdf() -> int:
+  # Checked on first use rather than at import, so importing the constants
+  # doesn't touch the filesystem. Returns the URDF's mtime for cache keys.
+  try:
+    return X02_URDF.stat().st_mtime_ns
+  except FileNotFoundError:
+    raise FileNotFoundError(f"x02 URDF not found: {X02_URDF}") from None
+
+
+@functools.cache
+def _read_assets(meshdir: str) -> dict[str, bytes]:
+  _require_urdf()
   assets: dict[str, bytes] = {}
   update_assets(assets, X02_URDF.parent / "assets", meshdir)
   return assets
 
 
+def get_assets(meshdir: str) -> dict[str, bytes]:
+  # Mesh files are only read from disk once; hand out a shallow copy so callers
+  # can't mutate the cached dict.
+  return dict(_read_assets(meshdir))
+
+
 def get_spec() -> mujoco.MjSpec:
-  spec = mujoco.MjSpec.from_file(str(X02_URDF))
+  key = (str(X02_URDF), _require_urdf())
+  if key not in _SPEC_CACHE:
+    _SPEC_CACHE[key] = mujoco.MjSpec.from_file(str(X02_URDF))
+  spec = _SPEC_CACHE[key].copy()
   spec.assets = get_assets(spec.meshdir)
   return spec
 
@@ -166,6 +192,12 @@ for a in X02_ARTICULATION.actuators:
   for n in names:
     X02_ACTION_SCALE[n] = 0.25 * e / s
 
+# Same mapping with the joint name regexes compiled once, so consumers matching
+# many joint names don't have to recompile the patterns.
+X02_ACTION_SCALE_ITEMS: tuple[tuple[re.Pattern[str], float], ...] = tuple(
+  (re.compile(n), scale) for n, scale in X02_ACTION_SCALE.items()
+)
+
 
 if __name__ == "__main__":
   import mujoco.viewer as viewer
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable, Sequence
@@ -159,13 +160,15 @@ class Entity:
       return
 
     for actuator_cfg in self.cfg.articulation.actuators:
-      # Find targets based on transmission type.
+      # Find targets based on transmission type, using the config's precompiled
+      # target patterns.
+      patterns = actuator_cfg.target_names_patterns
       if actuator_cfg.transmission_type == TransmissionType.JOINT:
-        target_ids, target_names = self.find_joints(actuator_cfg.target_names_expr)
+        target_ids, target_names = self.find_joints(patterns)
       elif actuator_cfg.transmission_type == TransmissionType.TENDON:
-        target_ids, target_names = self.find_tendons(actuator_cfg.target_names_expr)
+        target_ids, target_names = self.find_tendons(patterns)
       elif actuator_cfg.transmission_type == TransmissionType.SITE:
-        target_ids, target_names = self.find_sites(actuator_cfg.target_names_expr)
+        target_ids, target_names = self.find_sites(patterns)
       else:
         raise ValueError(
           f"Invalid transmission_type: {actuator_cfg.transmission_type}. "
@@ -335,7 +338,7 @@ class Entity:
 
   def find_joints(
     self,
-    name_keys: str | Sequence[str],
+    name_keys: str | re.Pattern[str] | Sequence[str | re.Pattern[str]],
     joint_subset: Sequence[str] | None = None,
     preserve_order: bool = False,
   ) -> tuple[list[int], list[str]]:
@@ -355,7 +358,7 @@ class Entity:
 
   def find_tendons(
     self,
-    name_keys: str | Sequence[str],
+    name_keys: str | re.Pattern[str] | Sequence[str | re.Pattern[str]],
     tendon_subset: Sequence[str] | None = None,
     preserve_order: bool = False,
   ) -> tuple[list[int], list[str]]:
@@ -399,7 +402,7 @@ class Entity:
 
   def find_sites(
     self,
-    name_keys: str | Sequence[str],
+    name_keys: str | re.Pattern[str] | Sequence[str | re.Pattern[str]],
     site_subset: Sequence[str] | None = None,
     preserve_order: bool = False,
   ) -> tuple[list[int], list[str]]:
@@ -24,7 +24,7 @@ class MotionLoader:
   def __init__(
     self,
     motion_file: str,
-    input_fps: int,
+    input_fps: float | None,
     output_fps: int,
     device: torch.device | str,
     line_range: tuple[int, int] | None = None,
@@ -32,7 +32,6 @@ class MotionLoader:
     self.motion_file = motion_file
     self.input_fps = input_fps
     self.output_fps = output_fps
-    self.input_dt = 1.0 / self.input_fps
     self.output_dt = 1.0 / self.output_fps
     self.current_idx = 0
     self.device = device
@@ -42,18 +41,38 @@ class MotionLoader:
     self._compute_velocities()
 
   def _load_motion(self):
-    """Loads the motion from the csv file."""
-    if self.line_range is None:
-      motion = torch.from_numpy(np.loadtxt(self.motion_file, delimiter=","))
+    """Loads the motion from the csv file (or an npz from pkl_to_csv.py)."""
+    if self.motion_file.endswith(".npz"):
+      with np.load(self.motion_file) as data:
+        motion_np = np.concatenate(
+          [data["root_pos"], data["root_rot"], data["dof"]], axis=1
+        )
+        stored_fps = float(data["fps"])
+      if self.input_fps is None:
+        self.input_fps = stored_fps
+      elif self.input_fps != stored_fps:
+        print(
+          f"[WARNING]: --input-fps {self.input_fps} overrides the {stored_fps} fps"
+          f" stored in {self.motion_file}."
+        )
+      if self.line_range is not None:
+        motion_np = motion_np[self.line_range[0] - 1 : self.line_range[1]]
+      motion = torch.from_numpy(motion_np)
     else:
-      motion = torch.from_numpy(
-        np.loadtxt(
-          self.motion_file,
-          delimiter=",",
-          skiprows=self.line_range[0] - 1,
-          max_rows=self.line_range[1] - self.line_range[0] + 1,
+      if self.input_fps is None:
+        self.input_fps = 30.0
+      if self.line_range is None:
+        motion = torch.from_numpy(np.loadtxt(self.motion_file, delimiter=","))
+      else:
+        motion = torch.from_numpy(
+          np.loadtxt(
+            self.motion_file,
+            delimiter=",",
+            skiprows=self.line_range[0] - 1,
+            max_rows=self.line_range[1] - self.line_range[0] + 1,
+          )
         )
-      )
+    self.input_dt = 1.0 / self.input_fps
     motion = motion.to(torch.float32).to(self.device)
     # motion[:, 2] -= 0.05
     self.motion_base_poss_input = motion[:, :3]
@@ -339,7 +358,7 @@ def run_sim(
 def main(
   input_file: str,
   output_name: str,
-  input_fps: float = 30.0,
+  input_fps: float | None = None,
   output_fps: float = 50.0,
   device: str = "cuda:0",
   render: bool = False,
@@ -348,13 +367,15 @@ def main(
   """Replay motion from CSV file and output to npz file.
 
   Args:
-    input_file: Path to the input CSV file.
+    input_file: Path to the input CSV file, or an ``.npz`` written by
+      ``pkl_to_csv.py --output-format npz``.
     output_name: Path to the output npz file.
-    input_fps: Frame rate of the CSV file.
+    input_fps: Frame rate of the input motion. Defaults to the fps stored in an
+      npz input, or 30 for CSV.
     output_fps: Desired output frame rate.
     device: Device to use.
     render: Whether to render the simulation and save a video.
-    line_range: Range of lines to process from the CSV file.
+    line_range: Range of lines (frames for npz input) to process.
   """
   if device.startswith("cuda") and not torch.cuda.is_available():
     print("[WARNING]: CUDA is not available. Falling back to CPU. This may be slow.")
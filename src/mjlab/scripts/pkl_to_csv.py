@@ -4,16 +4,40 @@ The PKL dataset has 23 DOF (no wrist joints). This script maps them to the
 29-joint ordering expected by csv_to_npz.py, inserting zeros for the 6 missing
 wrist joints.
 
+With ``--output-format npz`` the motion is written as a binary ``.npz`` holding
+``root_pos``, ``root_rot`` (xyzw), ``dof`` (29 joints) and ``fps`` instead,
+which csv_to_npz.py also accepts as input. This skips the float → ASCII → float
+round-trip entirely.
+
+Uncompressed PKLs are memory-mapped, so only the selected motion is read from
+disk. When regenerating PKLs, ``compress=("lz4", 3)`` (requires the ``lz4``
+package) loads several times faster than the default zlib/xz compression, and
+``compress=0`` allows memory-mapping:
+
+    joblib.dump(motions, "motions.pkl", compress=("lz4", 3))
+
 Usage:
-    uv run python -m mjlab.scripts.pkl_to_csv input.pkl output.csv
-    uv run python -m mjlab.scripts.pkl_to_csv input.pkl output.csv --list-keys
+    uv run python -m mjlab.scripts.pkl_to_csv convert \
+        --input-file input.pkl --output-file output.csv
+    uv run python -m mjlab.scripts.pkl_to_csv convert \
+        --input-file input.pkl --output-file output.csv --list-keys
+    uv run python -m mjlab.scripts.pkl_to_csv convert \
+        --input-file input.pkl --output-file output.npz --output-format npz
+
+Convert a whole directory in parallel (one worker process per file):
+    uv run python -m mjlab.scripts.pkl_to_csv batch \
+        --input-glob "motions/**/*.pkl" --output-dir motions_csv
 """
 
+import glob
+import sys
 from pathlib import Path
+from typing import Literal
 
 import joblib
 import numpy as np
 import tyro
+from joblib import Parallel, delayed
 
 # 23-DOF ordering in the openhe PKL files (no wrist joints).
 DOF_23_NAMES = [
@@ -77,17 +101,175 @@ DOF_29_NAMES = [
 
 # Build mapping: for each of the 29 joints, index into 23-DOF array or -1.
 _DOF23_INDEX = {name: i for i, name in enumerate(DOF_23_NAMES)}
-DOF_29_TO_23_MAP = [_DOF23_INDEX.get(name, -1) for name in DOF_29_NAMES]
+DOF_29_TO_23_MAP = np.fromiter(
+  (_DOF23_INDEX.get(name, -1) for name in DOF_29_NAMES),
+  dtype=np.intp,
+  count=len(DOF_29_NAMES),
+)
+
+# Gather indices into the 23-DOF array (missing joints point at column 0) and the
+# columns of the 6 wrist joints missing from the PKL, which are zeroed after the
+# gather.
+_GATHER_IDX = np.maximum(DOF_29_TO_23_MAP, 0)
+WRIST_COLS = np.flatnonzero(DOF_29_TO_23_MAP < 0)
+
+
+def map_23_to_29(dof_23: np.ndarray, out: np.ndarray | None = None) -> np.ndarray:
+  """Map (T, 23) joint array to (T, 29), filling missing joints with 0.
+
+  If ``out`` is given, the joints are gathered directly into it (e.g. a column
+  slice of a larger buffer) instead of into a newly allocated array.
+  """
+  if dof_23.ndim != 2 or dof_23.shape[1] != len(DOF_23_NAMES):
+    raise ValueError(
+      f"Expected dof of shape (T, {len(DOF_23_NAMES)}), got {dof_23.shape}"
+    )
+  if out is None:
+    out = np.empty((dof_23.shape[0], 29), dtype=dof_23.dtype)
+  # The width is checked above, so every index is in range and mode="clip" only
+  # lets take() write into out unbuffered.
+  src = dof_23.astype(out.dtype, copy=False)
+  np.take(src, _GATHER_IDX, axis=1, out=out, mode="clip")
+  out[:, WRIST_COLS] = 0
+  return out
+
+
+_DECIMALS = 8
+_SCALE = 10.0**_DECIMALS
+# Largest |x| whose scaled value is still an exactly representable integer.
+_MAX_FIXED = 2.0**53 / _SCALE
+
+
+def _format_fixed(data: np.ndarray) -> bytes:
+  """Format a (T, N) float array as ``%.8f`` CSV text without per-cell Python.
+
+  Every cell is rounded to an integer number of 1e-8 units and its digits are
+  peeled off one position at a time across all cells at once. Each character
+  position is a contiguous (T, N) uint8 plane, so every digit pass streams
+  through memory; the planes are interleaved into rows by a single transpose
+  at the end. Unused positions hold 0 and are dropped, which yields the same
+  bytes as ``%.8f`` formatting. Cells whose scaled value lies within rounding
+  error of a .5 tie are formatted with ``%`` so the last digit always matches.
+  """
+  x = data.astype(np.float64, copy=False)
+  T, N = x.shape
+  scaled = np.abs(x) * _SCALE
+  q = np.rint(scaled)
+  tie = np.abs(np.abs(scaled - q) - 0.5) <= 4 * np.spacing(scaled)
+  q = q.astype(np.int64)
+  if tie.any():
+    q[tie] = [int(("%.8f" % v).replace(".", "")) for v in np.abs(x[tie])]
+
+  int_part, frac_part = np.divmod(q, 10**_DECIMALS)
+  frac_part = frac_part.astype(np.int32)
+  n_int = max(len(str(int(int_part.max(initial=0)))), 1)
+  # Cell layout: sign, integer digits, ".", fractional digits, separator.
+  width = 1 + n_int + 1 + _DECIMALS + 1
+  planes = np.empty((width, T, N), dtype=np.uint8)
+  planes[0] = np.where(np.signbit(x), ord("-"), 0)
+  for k in range(n_int):
+    int_part, digit = np.divmod(int_part, 10)
+    # Leading zeros stay empty, except for the units digit.
+    leading = (digit == 0) & (int_part == 0) & (k > 0)
+    planes[n_int - k] = np.where(leading, 0, digit + ord("0"))
+  planes[n_int + 1] = ord(".")
+  for k in range(_DECIMALS):
+    frac_part, digit = np.divmod(frac_part, 10)
+    planes[n_int + 1 + _DECIMALS - k] = digit + ord("0")
+  planes[-1, :, :-1] = ord(",")
+  planes[-1, :, -1] = ord("\n")
+  return planes.transpose(1, 2, 0).tobytes().translate(None, b"\0")
+
+
+def write_csv(path: Path, data: np.ndarray, chunk_rows: int = 16384) -> None:
+  """Write a (T, N) float array as comma-separated ``%.8f`` rows.
+
+  Rows are formatted in blocks of ``chunk_rows`` by :func:`_format_fixed`, which
+  builds the text with array operations instead of per-row Python, while
+  keeping the intermediate buffers bounded in size. Non-finite or very large
+  values fall back to ``%`` formatting of the block.
+  """
+  N = data.shape[1]
+  row_fmt = ",".join(["%.8f"] * N) + "\n"
+  with open(path, "wb", buffering=1 << 20) as f:
+    for start in range(0, data.shape[0], chunk_rows):
+      chunk = data[start : start + chunk_rows]
+      if np.all(np.abs(chunk) < _MAX_FIXED):
+        f.write(_format_fixed(chunk))
+      else:
+        text = (row_fmt * chunk.shape[0]) % tuple(chunk.ravel().tolist())
+        f.write(text.encode("ascii"))
+
+
+def load_pkl(path: str | Path) -> dict:
+  """Load a joblib PKL, memory-mapping its arrays when the file is uncompressed.
+
+  Compressed files (zlib, gzip, bz2, xz, lz4, ...) are decompressed by joblib as
+  usual; memory-mapping only applies to raw pickles, which start with the pickle
+  PROTO opcode.
+  """
+  with open(path, "rb") as f:
+    uncompressed = f.read(1) == b"\x80"
+  return joblib.load(path, mmap_mode="r" if uncompressed else None)
+
+
+def _convert_one(
+  input_file: str,
+  output_file: str | Path,
+  motion_key: str | None = None,
+  output_format: Literal["csv", "npz"] = "csv",
+) -> tuple[Path, int]:
+  """Convert a single motion of a PKL file. Returns the output path and fps."""
+  data = load_pkl(input_file)
+
+  if motion_key is None:
+    motion_key = next(iter(data.keys()))
+    print(f"Using motion key: '{motion_key}'")
+
+  motion = data[motion_key]
+  root_pos = motion["root_trans_offset"]  # (T, 3)
+  root_rot = motion["root_rot"]  # (T, 4) — assumed wxyz
+  dof = motion["dof"]  # (T, 23)
+  fps = motion.get("fps", 30)
+
+  print(f"Motion: {root_pos.shape[0]} frames at {fps} FPS")
+  print(f"  root_pos: {root_pos.shape}, root_rot: {root_rot.shape}, dof: {dof.shape}")
+
+  # Assemble [base_pos(3), base_rot_xyzw(4), joints(29)] = 36 columns into a
+  # single preallocated buffer, writing each block directly into its slice.
+  # The buffer takes the common dtype of the inputs: a float32 PKL stays float32
+  # (half the bytes for the formatter to read), while float64 data is not
+  # downcast, which would round it twice on the way to csv_to_npz.py.
+  T = root_pos.shape[0]
+  csv_data = np.empty((T, 36), dtype=np.result_type(root_pos, root_rot, dof))
+  csv_data[:, 0:3] = root_pos
+  # csv_to_npz.py expects quaternion in xyzw order and converts to wxyz
+  # internally. The PKL already stores xyzw, so pass through as-is.
+  csv_data[:, 3:7] = root_rot
+  # Map 23 DOF → 29 joints.
+  map_23_to_29(dof, out=csv_data[:, 7:])
 
+  output_path = Path(output_file)
+  output_path.parent.mkdir(parents=True, exist_ok=True)
+
+  if output_format == "npz":
+    output_path = output_path.with_suffix(".npz")
+    np.savez(
+      output_path,
+      root_pos=csv_data[:, 0:3],
+      root_rot=csv_data[:, 3:7],
+      dof=csv_data[:, 7:],
+      fps=np.float64(fps),
+    )
+    print(f"Saved NPZ: {output_path} ({T} frames)")
+  else:
+    write_csv(output_path, csv_data)
+    print(
+      f"Saved CSV: {output_path}"
+      f" ({csv_data.shape[0]} frames, {csv_data.shape[1]} columns)"
+    )
 
-def map_23_to_29(dof_23: np.ndarray) -> np.ndarray:
-  """Map (T, 23) joint array to (T, 29), filling missing joints with 0."""
-  T = dof_23.shape[0]
-  dof_29 = np.zeros((T, 29), dtype=dof_23.dtype)
-  for i_29, i_23 in enumerate(DOF_29_TO_23_MAP):
-    if i_23 >= 0:
-      dof_29[:, i_29] = dof_23[:, i_23]
-  return dof_29
+  return output_path, fps
 
 
 def main(
@@ -95,18 +277,22 @@ def main(
   output_file: str,
   motion_key: str | None = None,
   list_keys: bool = False,
+  output_format: Literal["csv", "npz"] = "csv",
 ):
-  """Convert a PKL motion file to CSV format for csv_to_npz.py.
+  """Convert a PKL motion file to CSV (or NPZ) format for csv_to_npz.py.
 
   Args:
       input_file: Path to the PKL file from openhe/g1-retargeted-motions.
-      output_file: Path for the output CSV file.
+      output_file: Path for the output file. For the npz format the suffix is
+          replaced with ``.npz``.
       motion_key: Key inside the PKL dict. If None, uses the first key.
       list_keys: If True, just print available keys and exit.
+      output_format: Write ASCII CSV or a binary ``.npz`` archive.
   """
-  data = joblib.load(input_file)
-
   if list_keys:
+    # Only shapes and fps are touched, so for uncompressed files no array payload
+    # is read from disk.
+    data = load_pkl(input_file)
     print("Available keys in PKL file:")
     for key in data.keys():
       motion = data[key]
@@ -115,46 +301,90 @@ def main(
       print(f"  '{key}' — {n_frames} frames, {fps} fps")
     return
 
-  if motion_key is None:
-    motion_key = next(iter(data.keys()))
-    print(f"Using motion key: '{motion_key}'")
+  output_path, fps = _convert_one(input_file, output_file, motion_key, output_format)
 
-  motion = data[motion_key]
-  root_pos = motion["root_trans_offset"]  # (T, 3)
-  root_rot = motion["root_rot"]  # (T, 4) — assumed wxyz
-  dof = motion["dof"]  # (T, 23)
-  fps = motion.get("fps", 30)
+  if output_format == "npz":
+    # The fps is stored in the npz and picked up by csv_to_npz.py.
+    print("\nNext step — replay through csv_to_npz.py:")
+    print(
+      f"  uv run python -m mjlab.scripts.csv_to_npz"
+      f" --input-file {output_path}"
+      f" --output-name my_motion"
+    )
+  else:
+    print("\nNext step — convert to NPZ:")
+    print(
+      f"  uv run python -m mjlab.scripts.csv_to_npz"
+      f" --input-file {output_path}"
+      f" --input-fps {fps}"
+      f" --output-name my_motion"
+    )
 
-  print(f"Motion: {root_pos.shape[0]} frames at {fps} FPS")
-  print(f"  root_pos: {root_pos.shape}, root_rot: {root_rot.shape}, dof: {dof.shape}")
 
-  # csv_to_npz.py expects quaternion in xyzw order and converts to wxyz
-  # internally. The PKL already stores xyzw, so pass through as-is.
-  root_rot_xyzw = root_rot
+def _glob_base(pattern: str) -> Path:
+  """Return the leading directories of a glob pattern that contain no wildcards."""
+  base = Path()
+  for part in Path(pattern).parent.parts:
+    if glob.has_magic(part):
+      break
+    base /= part
+  return base
 
-  # Map 23 DOF → 29 joints.
-  dof_29 = map_23_to_29(dof)
 
-  # Assemble CSV: [base_pos(3), base_rot_xyzw(4), joints(29)] = 36 columns.
-  csv_data = np.concatenate([root_pos, root_rot_xyzw, dof_29], axis=1)
+def main_batch(
+  input_glob: str,
+  output_dir: str,
+  n_jobs: int = -1,
+  output_format: Literal["csv", "npz"] = "csv",
+):
+  """Convert every PKL file matching a glob, one worker process per file.
+
+  Each file's first motion is written under ``output_dir``, keeping its path
+  relative to the non-wildcard part of the glob, e.g. ``motions/a/walk.pkl``
+  matched by ``motions/**/*.pkl`` becomes ``<output_dir>/a/walk.csv``.
 
-  output_path = Path(output_file)
-  output_path.parent.mkdir(parents=True, exist_ok=True)
-  np.savetxt(output_path, csv_data, delimiter=",", fmt="%.8f")
+  Args:
+      input_glob: Glob pattern for the PKL files, e.g. ``motions/**/*.pkl``.
+      output_dir: Directory for the converted files.
+      n_jobs: Number of worker processes. -1 uses all cores.
+      output_format: Write ASCII CSV or a binary ``.npz`` archive.
+  """
+  paths = sorted(glob.glob(input_glob, recursive=True))
+  if not paths:
+    raise FileNotFoundError(f"No PKL files match '{input_glob}'")
 
-  print(
-    f"Saved CSV: {output_path} ({csv_data.shape[0]} frames, {csv_data.shape[1]} columns)"
-  )
-  print(f"\nNext step — convert to NPZ:")
-  print(
-    f"  uv run python -m mjlab.scripts.csv_to_npz"
-    f" --input-file {output_path}"
-    f" --input-fps {fps}"
-    f" --output-name my_motion"
+  base = _glob_base(input_glob)
+  out_dir = Path(output_dir)
+  outputs = [
+    out_dir / Path(p).relative_to(base).with_suffix(f".{output_format}") for p in paths
+  ]
+  results = Parallel(n_jobs=n_jobs, backend="loky")(
+    delayed(_convert_one)(p, out, None, output_format)
+    for p, out in zip(paths, outputs, strict=True)
   )
 
+  print(f"\nConverted {len(results)} files into {out_dir}:")
+  for output_path, fps in results:
+    print(f"  {output_path} — {fps} fps")
+  if output_format == "csv":
+    print("Pass each file's fps as --input-fps to csv_to_npz.py.")
+
 
 if __name__ == "__main__":
   import mjlab
 
-  tyro.cli(main, config=mjlab.TYRO_FLAGS)
+  # Parse the first argument to choose between one file and a batch. Help is only
+  # handled here when no command follows, so `batch --help` reaches main_batch.
+  commands = {"convert": main, "batch": main_batch}
+  chosen_command, remaining_args = tyro.cli(
+    tyro.extras.literal_type_from_choices(list(commands)),
+    add_help=len(sys.argv) <= 2,
+    return_unknown_args=True,
+    config=mjlab.TYRO_FLAGS,
+  )
+  tyro.cli(
+    commands[chosen_command],
+    args=remaining_args,
+    prog=sys.argv[0] + f" {chosen_command}",
+    config=mjlab.TYRO_FLAGS,
+  )
@@ -176,7 +176,9 @@ Regex operations.
 
 
 def resolve_matching_names(
-    keys: str | Sequence[str], list_of_strings: Sequence[str], preserve_order: bool = False
+    keys: str | re.Pattern[str] | Sequence[str | re.Pattern[str]],
+    list_of_strings: Sequence[str],
+    preserve_order: bool = False,
 ) -> tuple[list[int], list[str]]:
     """Match a list of query regular expressions against a list of strings and return the matched indices and names.
 
@@ -200,6 +202,7 @@ def resolve_matching_names(
 
     Args:
         keys: A regular expression or a list of regular expressions to match the strings in the list.
+            Already compiled patterns are accepted as well.
         list_of_strings: A list of strings to match.
         preserve_order: Whether to preserve the order of the query keys in the returned values. Defaults to False.
 
@@ -211,8 +214,11 @@ def resolve_matching_names(
         ValueError: When not all regular expressions are matched.
     """
     # resolve name keys
-    if isinstance(keys, str):
+    if isinstance(keys, (str, re.Pattern)):
         keys = [keys]
+    # compile each key once (no-op for compiled patterns) and keep the plain strings for messages
+    patterns = [re.compile(key) for key in keys]
+    keys = [pattern.pattern for pattern in patterns]
     # find matching patterns
     index_list = []
     names_list = []
@@ -223,8 +229,8 @@ def resolve_matching_names(
     keys_match_found = [[] for _ in range(len(keys))]
     # loop over all target strings
     for target_index, potential_match_string in enumerate(list_of_strings):
-        for key_index, re_key in enumerate(keys):
-            if re.fullmatch(re_key, potential_match_string):
+        for key_index, (re_key, pattern) in enumerate(zip(keys, patterns)):
+            if pattern.fullmatch(potential_match_string):
                 # check if match already found
                 if target_strings_match_found[target_index]:
                     raise ValueError(
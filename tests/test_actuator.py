@@ -84,3 +84,16 @@ def test_targets_cleared_on_reset(device, robot_xml):
   assert torch.allclose(
     entity.data.joint_effort_target, torch.zeros(1, 2, device=device)
   )
+
+
+def test_target_names_patterns_cached_and_tracks_expr():
+  """target_names_patterns is compiled once and follows target_names_expr."""
+  cfg = BuiltinPositionActuatorCfg(
+    target_names_expr=("joint.*", "other"), stiffness=50.0, damping=5.0
+  )
+  patterns = cfg.target_names_patterns
+  assert [p.pattern for p in patterns] == ["joint.*", "other"]
+  assert cfg.target_names_patterns is patterns
+
+  cfg.target_names_expr = ("joint1",)
+  assert [p.pattern for p in cfg.target_names_patterns] == ["joint1"]
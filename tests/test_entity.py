@@ -1,5 +1,6 @@
 """Tests for entity module."""
 
+import re
 from dataclasses import dataclass
 
 import mujoco
@@ -270,6 +271,30 @@ def test_find_with_subset_filtering():
     entity.find_joints("joint1", joint_subset=["joint2"])
 
 
+def test_find_with_compiled_patterns():
+  """Compiled patterns match like strings and errors report the plain regex."""
+  entity = create_floating_articulated_entity()
+  assert entity.find_joints(re.compile("joint.*"))[1] == ["joint1", "joint2"]
+
+  with pytest.raises(ValueError, match="Not all regular expressions") as exc_info:
+    entity.find_joints([re.compile("joint1"), re.compile("missing_.*")])
+  assert "\tmissing_.*: []" in str(exc_info.value)
+  assert "re.compile" not in str(exc_info.value)
+
+  cfg = EntityCfg(
+    spec_fn=lambda: mujoco.MjSpec.from_string(FLOATING_BASE_ARTICULATED_XML),
+    articulation=EntityArticulationInfoCfg(
+      actuators=(
+        BuiltinPositionActuatorCfg(
+          target_names_expr=("missing_.*",), stiffness=1.0, damping=1.0
+        ),
+      )
+    ),
+  )
+  with pytest.raises(ValueError, match=re.escape("missing_.*: []")):
+    Entity(cfg)
+
+
 def test_root_state_read_write(device):
   """Test root state can be written and read from simulation."""
   entity = create_floating_base_entity()
@@ -0,0 +1,160 @@
+"""Tests for pkl_to_csv.py."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+joblib = pytest.importorskip("joblib")
+
+from mjlab.scripts import pkl_to_csv  # noqa: E402
+from mjlab.scripts.csv_to_npz import MotionLoader  # noqa: E402
+
+
+def _savetxt_bytes(tmp_path, data: np.ndarray) -> bytes:
+  path = tmp_path / "reference.csv"
+  np.savetxt(path, data, delimiter=",", fmt="%.8f")
+  return path.read_bytes()
+
+
+def _write_csv_bytes(tmp_path, data: np.ndarray, **kwargs) -> bytes:
+  path = tmp_path / "out.csv"
+  pkl_to_csv.write_csv(path, data, **kwargs)
+  return path.read_bytes()
+
+
+def test_write_csv_matches_savetxt_on_edge_values(tmp_path):
+  rng = np.random.default_rng(0)
+  ties = (rng.integers(-(10**9), 10**9, size=(16, 36)) + 0.5) * 1e-8
+  special = np.array(
+    [-0.0, 0.0, -1e-10, 1e-10, 0.5e-8, -0.5e-8, 1.5e-8, 0.999999995]
+    + [9.999999995, -9.999999995, 123456.7, -1.0, 99.99999999, 1e7]
+    + [-1e7, 0.5, -0.5, 1.0] * 5
+    + [2.0, -2.0]
+  ).reshape(1, 36)
+  random = rng.standard_normal((64, 36)) * 10.0 ** rng.integers(-9, 6, (64, 36))
+  data = np.concatenate([ties, special, random])
+
+  assert _write_csv_bytes(tmp_path, data) == _savetxt_bytes(tmp_path, data)
+  data32 = data.astype(np.float32)
+  assert _write_csv_bytes(tmp_path, data32) == _savetxt_bytes(tmp_path, data32)
+
+
+def test_write_csv_chunks_with_non_finite_block(tmp_path):
+  """Chunk boundaries and the % fallback for non-finite chunks are seamless."""
+  rng = np.random.default_rng(1)
+  data = rng.standard_normal((10, 36))
+  data[4, 0] = np.nan
+  data[5, 1] = np.inf
+  data[5, 2] = -np.inf
+
+  out = _write_csv_bytes(tmp_path, data, chunk_rows=3)
+  assert out == _savetxt_bytes(tmp_path, data)
+
+
+def test_map_23_to_29_matches_loop():
+  rng = np.random.default_rng(2)
+  dof_23 = rng.standard_normal((5, 23))
+
+  expected = np.zeros((5, 29))
+  for i_29, name in enumerate(pkl_to_csv.DOF_29_NAMES):
+    if name in pkl_to_csv.DOF_23_NAMES:
+      expected[:, i_29] = dof_23[:, pkl_to_csv.DOF_23_NAMES.index(name)]
+
+  np.testing.assert_array_equal(pkl_to_csv.map_23_to_29(dof_23), expected)
+
+  buf = np.full((5, 36), np.nan)
+  pkl_to_csv.map_23_to_29(dof_23, out=buf[:, 7:])
+  np.testing.assert_array_equal(buf[:, 7:], expected)
+  assert np.isnan(buf[:, :7]).all()
+
+
+def test_map_23_to_29_rejects_wrong_width():
+  with pytest.raises(ValueError, match=r"got \(5, 22\)"):
+    pkl_to_csv.map_23_to_29(np.zeros((5, 22)))
+
+
+def test_npz_round_trip_through_motion_loader(tmp_path):
+  rng = np.random.default_rng(3)
+  T = 20
+  root_rot = rng.standard_normal((T, 4))
+  root_rot /= np.linalg.norm(root_rot, axis=1, keepdims=True)
+  motion = {
+    "root_trans_offset": rng.standard_normal((T, 3)),
+    "root_rot": root_rot,
+    "dof": rng.standard_normal((T, 23)),
+    "fps": 50,
+  }
+  joblib.dump({"clip": motion}, tmp_path / "motion.pkl")
+
+  out_path, fps = pkl_to_csv._convert_one(
+    str(tmp_path / "motion.pkl"), tmp_path / "motion.csv", output_format="npz"
+  )
+  assert out_path == tmp_path / "motion.npz"
+  assert fps == 50
+
+  loader = MotionLoader(
+    str(out_path), input_fps=None, output_fps=50, device="cpu", line_range=(3, 12)
+  )
+  assert loader.input_fps == 50
+  assert loader.input_frames == 10
+
+  rows = slice(2, 12)
+  expected_pos = motion["root_trans_offset"][rows]
+  expected_rot_wxyz = root_rot[rows][:, [3, 0, 1, 2]]
+  expected_dof = pkl_to_csv.map_23_to_29(motion["dof"])[rows]
+  for actual, expected in (
+    (loader.motion_base_poss_input, expected_pos),
+    (loader.motion_base_rots_input, expected_rot_wxyz),
+    (loader.motion_dof_poss_input, expected_dof),
+  ):
+    torch.testing.assert_close(actual, torch.from_numpy(expected).float())
+
+
+def test_npz_keeps_fractional_fps(tmp_path):
+  motion = {
+    "root_trans_offset": np.zeros((2, 3)),
+    "root_rot": np.zeros((2, 4)),
+    "dof": np.zeros((2, 23)),
+    "fps": 29.97,
+  }
+  joblib.dump({"clip": motion}, tmp_path / "motion.pkl")
+
+  out_path, _ = pkl_to_csv._convert_one(
+    str(tmp_path / "motion.pkl"), tmp_path / "motion.npz", output_format="npz"
+  )
+  with np.load(out_path) as data:
+    assert float(data["fps"]) == 29.97
+
+
+def test_glob_base_stops_at_first_wildcard():
+  assert pkl_to_csv._glob_base("motions/*.pkl") == Path("motions")
+  assert pkl_to_csv._glob_base("motions/**/*.pkl") == Path("motions")
+  assert pkl_to_csv._glob_base("*.pkl") == Path()
+
+
+def test_main_batch_keeps_relative_paths(tmp_path, capsys):
+  for i, sub in enumerate(("a", "b")):
+    motion = {
+      "root_trans_offset": np.full((2, 3), i, dtype=np.float64),
+      "root_rot": np.zeros((2, 4)),
+      "dof": np.zeros((2, 23)),
+      "fps": 30 + i,
+    }
+    (tmp_path / "in" / sub).mkdir(parents=True)
+    joblib.dump({"clip": motion}, tmp_path / "in" / sub / "walk.pkl")
+
+  out_dir = tmp_path / "out"
+  pkl_to_csv.main_batch(str(tmp_path / "in" / "**" / "*.pkl"), str(out_dir), n_jobs=1)
+
+  assert sorted(p.relative_to(out_dir) for p in out_dir.rglob("*.csv")) == [
+    Path("a/walk.csv"),
+    Path("b/walk.csv"),
+  ]
+  for i, sub in enumerate(("a", "b")):
+    csv = np.loadtxt(out_dir / sub / "walk.csv", delimiter=",")
+    np.testing.assert_array_equal(csv[:, :3], i)
+  stdout = capsys.readouterr().out
+  assert f"{out_dir / 'a' / 'walk.csv'} — 30 fps" in stdout
+  assert f"{out_dir / 'b' / 'walk.csv'} — 31 fps" in stdout
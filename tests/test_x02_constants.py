@@ -0,0 +1,37 @@
+"""Tests for x02_constants.py."""
+
+import mujoco
+import pytest
+
+from mjlab.asset_zoo.robots.x02 import x02_constants
+from mjlab.entity import Entity
+
+
+def test_get_spec_returns_independent_copies() -> None:
+  spec = x02_constants.get_spec()
+  spec.worldbody.add_body(name="extra_body")
+
+  fresh = x02_constants.get_spec()
+  assert "extra_body" not in [b.name for b in fresh.bodies]
+  assert fresh.assets == x02_constants.get_assets(fresh.meshdir)
+
+  assets = x02_constants.get_assets(fresh.meshdir)
+  assets["extra_asset"] = b""
+  assert "extra_asset" not in x02_constants.get_assets(fresh.meshdir)
+
+
+def test_cached_spec_compiles() -> None:
+  x02_constants.get_spec()
+  robot = Entity(x02_constants.get_x02_robot_cfg())
+  assert isinstance(robot.compile(), mujoco.MjModel)
+
+
+def test_action_scale_items_match_action_scale() -> None:
+  items = {p.pattern: s for p, s in x02_constants.X02_ACTION_SCALE_ITEMS}
+  assert items == x02_constants.X02_ACTION_SCALE
+
+
+def test_missing_urdf_raises_clear_error(monkeypatch, tmp_path) -> None:
+  monkeypatch.setattr(x02_constants, "X02_URDF", tmp_path / "missing.urdf")
+  with pytest.raises(FileNotFoundError, match="x02 URDF not found"):
+    x02_constants.get_spec()